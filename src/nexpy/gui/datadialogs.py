@@ -13,6 +13,7 @@ from __future__ import (absolute_import, division, print_function,
 import six
 
 import bisect
+import fnmatch
 import logging
 import numbers
 import os
@@ -34,6 +35,10 @@ try:
     from collections import OrderedDict
 except ImportError:
     from ordereddict import OrderedDict
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
 
 from .utils import (confirm_action, display_message, report_error,
                     import_plugin, convertHTML, natural_sort, wrap, human_size,
@@ -46,6 +51,11 @@ from nexusformat.nexus import (NeXusError, NXgroup, NXfield, NXattr,
                                NXlink, NXlinkgroup, NXlinkfield,
                                NXroot, NXentry, NXdata, NXparameters, nxload)
 
+# Avoid a stat of every directory entry for custom icons (not in Qt4)
+file_dialog_options = QtWidgets.QFileDialog.Options()
+if hasattr(QtWidgets.QFileDialog, 'DontUseCustomDirectoryIcons'):
+    file_dialog_options |= QtWidgets.QFileDialog.DontUseCustomDirectoryIcons
+
 
 class NXWidget(QtWidgets.QWidget):
     """Customized widget for NeXpy widgets"""
@@ -280,10 +290,11 @@ class NXWidget(QtWidgets.QWidget):
         Opens a file dialog and sets the file text box to the chosen path.
         """
         dirname = self.get_default_directory(self.filename.text())
-        filename = getOpenFileName(self, 'Open File', dirname)
+        filename = getOpenFileName(self, 'Open File', dirname,
+                                   options=file_dialog_options)
         if os.path.exists(filename): # avoids problems if <Cancel> was selected
             dirname = os.path.dirname(filename)
-            self.filename.setText(str(filename))
+            self.filename.setText(filename)
             self.set_default_directory(dirname)
 
     def get_filename(self):
@@ -297,11 +308,11 @@ class NXWidget(QtWidgets.QWidget):
         Opens a file dialog and sets the directory text box to the chosen path.
         """
         dirname = self.get_default_directory()
-        dirname = QtWidgets.QFileDialog.getExistingDirectory(self, 
-                                                             'Choose Directory', 
-                                                             dirname)
+        dirname = QtWidgets.QFileDialog.getExistingDirectory(
+            self, 'Choose Directory', dirname, 
+            options=QtWidgets.QFileDialog.ShowDirsOnly | file_dialog_options)
         if os.path.exists(dirname):  # avoids problems if <Cancel> was selected
-            self.directoryname.setText(str(dirname))
+            self.directoryname.setText(dirname)
             self.set_default_directory(dirname)
 
     def get_directory(self):
@@ -327,6 +338,29 @@ class NXWidget(QtWidgets.QWidget):
                 suggestion = os.path.dirname(suggestion)
             self.default_directory = suggestion
 
+    def iter_filesindirectory(self, prefix='', extension='.*', 
+                              directory=None):
+        """
+        Yields the files in the selected directory in arbitrary order.
+        
+        Unlike `get_filesindirectory`, the directory entries are not
+        collected into a list before they are returned, so this should be
+        used when the order of the files is not needed.
+        """
+        if not directory:
+            directory = self.get_directory()
+        if not extension.startswith('.'):
+            extension = '.'+extension
+        pattern = prefix+'*'+extension
+        if scandir:
+            filenames = (entry.name for entry in scandir(directory))
+        else:
+            filenames = os.listdir(directory)
+        for filename in filenames:
+            if (not filename.startswith('.') and 
+                fnmatch.fnmatch(filename, pattern)):
+                yield filename
+
     def get_filesindirectory(self, prefix='', extension='.*', directory=None):
         """
         Returns a list of files in the selected directory.
@@ -335,15 +369,10 @@ class NXWidget(QtWidgets.QWidget):
         numeric order when a file name consists of text and index so that, e.g., 
         'data2.tif' comes before 'data10.tif'.
         """
-        if directory:
-            os.chdir(directory)
-        else:
-            os.chdir(self.get_directory())
-        if not extension.startswith('.'):
-            extension = '.'+extension
-        from glob import glob
-        filenames = glob(prefix+'*'+extension)
-        return sorted(filenames,key=natural_sort)
+        keys = [(natural_sort(f), f) for f in 
+                self.iter_filesindirectory(prefix, extension, directory)]
+        keys.sort()
+        return [f for _, f in keys]
 
     def select_box(self, choices, default=None, slot=None):
         box = NXComboBox()
@@ -187,8 +187,7 @@ class FitDialog(BaseDialog):
     def initialize_functions(self):
 
         filenames = set()
-        private_path = os.path.join(os.path.expanduser('~'), '.nexpy', 
-                                    'functions')
+        private_path = self.mainwindow.function_dir
         if os.path.isdir(private_path):
             sys.path.append(private_path)
             for file_ in os.listdir(private_path):
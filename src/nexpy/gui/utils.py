@@ -35,6 +35,7 @@ except ImportError:
 from nexusformat.nexus import *
 
 ansi_re = re.compile('\x1b' + r'\[([\dA-Fa-f;]*?)m')
+_split_digits = re.compile(r'(\d+)').split
 
 
 def report_error(context, error):
@@ -148,8 +149,9 @@ def wrap(text, length):
 
 def natural_sort(key):
     """Sort numbers according to their value, not their first character"""
-    import re
-    return [int(t) if t.isdigit() else t for t in re.split(r'(\d+)', key)]    
+    tokens = _split_digits(key)
+    tokens[1::2] = map(int, tokens[1::2])
+    return tuple(tokens)
 
 
 def clamp(value, min_value, max_value):
@@ -277,12 +279,12 @@ def fix_projection(shape, axes, limits):
 
 
 def find_nearest(array, value):
-    idx = (np.abs(array-value)).argmin()
-    return array[idx]
+    return array[find_nearest_index(array, value)]
 
 
 def find_nearest_index(array, value):
-    return (np.abs(array-value)).argmin()
+    diff = np.asarray(array) - value
+    return np.abs(diff, out=diff).argmin()
 
 
 def format_float(value):
@@ -5,10 +5,10 @@ This module contains a set of customized widgets both for dialogs and plot objec
 from __future__ import absolute_import, division, unicode_literals
 
 import warnings
+from math import sqrt
 
 import matplotlib as mpl
 import numpy as np
-import six
 from matplotlib.cbook import mplDeprecation
 from matplotlib.patches import Circle, Ellipse, Polygon, Rectangle
 
@@ -23,6 +23,20 @@ except ImportError:
 
 warnings.filterwarnings("ignore", category=mplDeprecation)
 
+_get_plotview = None
+
+
+def _plotview():
+    """Return the current plotview.
+
+    The plotview module imports this module, so its function is imported 
+    on first use rather than at module level.
+    """
+    global _get_plotview
+    if _get_plotview is None:
+        from .plotview import get_plotview as _get_plotview
+    return _get_plotview()
+
 
 class NXStack(QtWidgets.QWidget):
     """Widget containing a stack of widgets selected by a dropdown menu.
@@ -88,7 +102,7 @@ class NXTextBox(QtWidgets.QLineEdit):
             Value of text box converted to a floating point number
 
         """
-        return float(six.text_type(self.text()))
+        return float(self.text())
 
     def setValue(self, value):
         """Set the value of the text box string formatted as a float.
@@ -99,12 +113,17 @@ class NXTextBox(QtWidgets.QLineEdit):
             Text box value to be formatted as a float
         
         """
-        self.setText(six.text_type(float('%.4g' % value)))
+        self.setText(str(float('%.4g' % value)))
 
 
 class NXComboBox(QtWidgets.QComboBox):
     """Dropdown menu for selecting a set of options."""
 
+    _SELECT_KEYS = frozenset((int(QtCore.Qt.Key_Up), 
+                              int(QtCore.Qt.Key_Down)))
+    _POPUP_KEYS = frozenset((int(QtCore.Qt.Key_Left), 
+                             int(QtCore.Qt.Key_Right)))
+
     def __init__(self, slot=None, items=[], default=None):
         """Initialize the dropdown menu with an initial list of items
         
@@ -142,11 +161,10 @@ class NXComboBox(QtWidgets.QComboBox):
             Keypress event that triggered the function
         
         """
-        if (event.key() == QtCore.Qt.Key_Up or 
-            event.key() == QtCore.Qt.Key_Down):
+        key = event.key()
+        if key in self._SELECT_KEYS:
             super(NXComboBox, self).keyPressEvent(event)
-        elif (event.key() == QtCore.Qt.Key_Right or 
-              event.key() == QtCore.Qt.Key_Left):
+        elif key in self._POPUP_KEYS:
             self.showPopup()
         else:
             self.parent().keyPressEvent(event)
@@ -198,6 +216,9 @@ class NXComboBox(QtWidgets.QComboBox):
 
 class NXCheckBox(QtWidgets.QCheckBox):
     """A checkbox with associated label and slot function."""
+
+    _TOGGLE_KEYS = frozenset((int(QtCore.Qt.Key_Up), 
+                              int(QtCore.Qt.Key_Down)))
  
     def __init__(self, label=None, slot=None, checked=False):
         """Initialize the checkbox.
@@ -229,8 +250,7 @@ class NXCheckBox(QtWidgets.QCheckBox):
             Keypress event that triggered the function
         
         """
-        if (event.key() == QtCore.Qt.Key_Up or 
-            event.key() == QtCore.Qt.Key_Down):
+        if event.key() in self._TOGGLE_KEYS:
             if self.isChecked():
                 self.setCheckState(QtCore.Qt.Unchecked)
             else:
@@ -242,6 +262,10 @@ class NXCheckBox(QtWidgets.QCheckBox):
 class NXPushButton(QtWidgets.QPushButton):
     """A button with associated label and slot function."""
 
+    _ACCEPT_KEYS = frozenset((int(QtCore.Qt.Key_Return), 
+                              int(QtCore.Qt.Key_Enter),
+                              int(QtCore.Qt.Key_Space)))
+
     def __init__(self, label, slot, parent=None):
         """Initialize button
         
@@ -272,9 +296,7 @@ class NXPushButton(QtWidgets.QPushButton):
             Keypress event that triggered the function
         
         """
-        if (event.key() == QtCore.Qt.Key_Return or 
-            event.key() == QtCore.Qt.Key_Enter or
-            event.key() == QtCore.Qt.Key_Space):
+        if event.key() in self._ACCEPT_KEYS:
             self.clicked.emit()
         else:
             self.parent().keyPressEvent(event)
@@ -355,6 +377,8 @@ class NXSpinBox(QtWidgets.QSpinBox):
         Data values.
     validator : QDoubleValidator
         Function to ensure only floating point values are entered.
+    reversed : bool
+        True if the data are in reverse order.
     old_value : float
         Previously stored value.
     diff : float
@@ -364,6 +388,8 @@ class NXSpinBox(QtWidgets.QSpinBox):
         Used when playing a movie with changing z-values.
  
     """
+    _validator = None
+
     def __init__(self, data=None):
         """Initialize the spin box
         
@@ -375,11 +401,22 @@ class NXSpinBox(QtWidgets.QSpinBox):
         """
         super(NXSpinBox, self).__init__()
         self.data = data
-        self.validator = QtGui.QDoubleValidator()
+        self.validator = self._get_validator()
         self.old_value = None
         self.diff = None
         self.pause = False
 
+    @classmethod
+    def _get_validator(cls):
+        """Return the validator shared by all instances of the class.
+
+        The validator is only created when the first spin box is 
+        initialized, since it requires a QApplication.
+        """
+        if cls._validator is None:
+            cls._validator = QtGui.QDoubleValidator()
+        return cls._validator
+
     def value(self):
         """Return the value of the spin box.
         
@@ -393,6 +430,33 @@ class NXSpinBox(QtWidgets.QSpinBox):
         else:
             return 0.0
 
+    @property
+    def data(self):
+        """The data values adjusted by the spin box."""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        """Set the data and precompute the bin centers and boundaries."""
+        self._data = value
+        self.reversed = False
+        self._centers = self._boundaries = self._step = None
+        self._sorted = True
+        if value is None:
+            return
+        self.reversed = bool(value[-1] < value[0])
+        if self.reversed:
+            self._centers = value[::-1]
+        else:
+            self._centers = value
+        if len(value) > 1:
+            self._boundaries = boundaries(self._centers, value.shape[0])
+            spacing = np.diff(self._centers.astype(np.float64))
+            self._sorted = bool(np.all(spacing >= 0))
+            step = spacing[0]
+            if step > 0 and np.allclose(spacing, step, rtol=1e-5, atol=0):
+                self._step = step
+
     @property
     def centers(self):
         """The values of the data points based on bin centers.
@@ -402,38 +466,23 @@ class NXSpinBox(QtWidgets.QSpinBox):
         array-like
             Data points set by the spin box
         """
-        if self.data is None:
-            return None
-        elif self.reversed:
-            return self.data[::-1]
-        else:
-            return self.data
+        return self._centers
 
     @property
     def boundaries(self):
-        if self.data is None:
-            return None
-        else:
-            return boundaries(self.centers, self.data.shape[0])
+        """The boundaries of the data bins."""
+        return self._boundaries
 
     @property
     def index(self):
         """Return the current index of the spin box."""
         return super(NXSpinBox, self).value()
 
-    @property
-    def reversed(self):
-        """Return `True` if the data are in reverse order."""
-        if self.data[-1] < self.data[0]:
-            return True
-        else:
-            return False
-
     def setValue(self, value):
         super(NXSpinBox, self).setValue(self.valueFromText(value))
 
     def valueFromText(self, text):
-        return self.indexFromValue(float(six.text_type(text)))
+        return self.indexFromValue(float(text))
 
     def textFromValue(self, value):
         try:
@@ -450,7 +499,30 @@ class NXSpinBox(QtWidgets.QSpinBox):
             return self.centers[idx]
 
     def indexFromValue(self, value):
-        return (np.abs(self.centers - value)).argmin()
+        """Return the index of the bin center closest to the value.
+
+        If the data are equally spaced, the index is calculated directly 
+        from the step size. Otherwise, if the bin centers are in ascending 
+        order, the index is found by a binary search rather than a scan of 
+        the whole array. Non-monotonic data are scanned for the nearest 
+        value.
+        """
+        centers = self.centers
+        if not self._sorted:
+            return np.abs(centers - value).argmin()
+        if self._step is not None and np.isfinite(value):
+            # Midpoints go to the lower index, as in the binary search
+            idx = int(np.ceil((value - centers[0]) / self._step - 0.5))
+            return min(max(idx, 0), len(centers) - 1)
+        idx = np.searchsorted(centers, value)
+        if idx <= 0:
+            return 0
+        elif idx >= len(centers):
+            return len(centers) - 1
+        elif value - centers[idx-1] <= centers[idx] - value:
+            return idx - 1
+        else:
+            return idx
 
     def minBoundaryValue(self, idx):
         if idx <= 0:
@@ -495,14 +567,23 @@ class NXSpinBox(QtWidgets.QSpinBox):
 
 class NXDoubleSpinBox(QtWidgets.QDoubleSpinBox):
 
+    _validator = None
+
     def __init__(self, data=None):
         super(NXDoubleSpinBox, self).__init__()
-        self.validator = QtGui.QDoubleValidator()
-        self.validator.setRange(-np.inf, np.inf)
-        self.validator.setDecimals(1000)
+        self.validator = self._get_validator()
         self.old_value = None
         self.diff = None
 
+    @classmethod
+    def _get_validator(cls):
+        """Return the validator shared by all instances of the class."""
+        if cls._validator is None:
+            cls._validator = QtGui.QDoubleValidator()
+            cls._validator.setRange(-np.inf, np.inf)
+            cls._validator.setDecimals(1000)
+        return cls._validator
+
     def validate(self, input_value, position):
         return self.validator.validate(input_value, position)
 
@@ -514,7 +595,7 @@ class NXDoubleSpinBox(QtWidgets.QDoubleSpinBox):
         self.editingFinished.emit()
 
     def valueFromText(self, text):
-        value = np.float32(text)
+        value = float(text)
         if value > self.maximum():
             self.setMaximum(value)
         elif value < self.minimum():
@@ -540,8 +621,7 @@ class NXpatch(object):
         if plotview:
             self.plotview = plotview
         else:
-            from .plotview import get_plotview
-            self.plotview = get_plotview()
+            self.plotview = _plotview()
         self.canvas = self.plotview.canvas
         self.shape = shape
         self.border_tol = border_tol
@@ -582,7 +662,10 @@ class NXpatch(object):
             self.press = None
             return
         self.press = self.initialize(event.xdata, event.ydata)
+        self.shape.set_animated(True)
         self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.shape.axes.bbox)
+        self.blit()
 
     def on_motion(self, event):
         """on motion we will move the rect if the mouse is over us"""
@@ -590,15 +673,23 @@ class NXpatch(object):
             return
         if event.inaxes != self.shape.axes: 
             return
+        self.canvas.restore_region(self.background)
         self.update(event.xdata, event.ydata)
-        self.canvas.draw()
+        self.blit()
 
     def on_release(self, event):
         'on release we reset the press data'
         if self.press is None:
             return
         self.press = None
-        self.canvas.draw()
+        self.shape.set_animated(False)
+        self.background = None
+        self.canvas.draw_idle()
+
+    def blit(self):
+        'redraw only the shape over the saved background'
+        self.shape.axes.draw_artist(self.shape)
+        self.canvas.blit(self.shape.axes.bbox)
 
     def disconnect(self):
         'disconnect all the stored connection ids'
@@ -669,9 +760,9 @@ class NXcircle(NXpatch):
 
     def radius_shift(self, x, y, xp, yp, x0, y0):
         xt, yt = self.pixel_shift(x, y, x0, y0)
-        r = np.sqrt(xt**2 + yt**2)
+        r = sqrt(xt**2 + yt**2)
         xt, yt = self.pixel_shift(xp, yp, x0, y0)
-        r0 = np.sqrt(xt**2 + yt**2)
+        r0 = sqrt(xt**2 + yt**2)
         return (self.inverse_transform((r,0)) - self.inverse_transform((r0,0)))[0]
     
     @property
@@ -696,9 +787,8 @@ class NXcircle(NXpatch):
         x0, y0 = self.circle.center
         w0, h0 = self.width, self.height
         xt, yt = self.pixel_shift(xp, yp, x0, y0)
-        rt = self.pixel_radius
-        if (self.allow_resize and
-            (np.sqrt(xt**2 + yt**2) > rt * (1-self.border_tol))):
+        rt = self.pixel_radius * (1-self.border_tol)
+        if (self.allow_resize and (rt < 0 or xt**2 + yt**2 > rt**2)):
             expand = True
         else:
             expand = False
@@ -747,10 +837,10 @@ class NXellipse(NXpatch):
         w0, h0 = self.ellipse.width, self.ellipse.height
         bt = self.border_tol
         if (self.allow_resize and
-            ((abs(x0-xp) < bt*w0 and abs(y0+np.true_divide(h0,2)-yp) < bt*h0) or
-             (abs(x0-xp) < bt*w0 and abs(y0-np.true_divide(h0,2)-yp) < bt*h0) or
-             (abs(y0-yp) < bt*h0 and abs(x0+np.true_divide(w0,2)-xp) < bt*w0) or
-             (abs(y0-yp) < bt*h0 and abs(x0-np.true_divide(w0,2)-xp) < bt*w0))):
+            ((abs(x0-xp) < bt*w0 and abs(y0+h0/2-yp) < bt*h0) or
+             (abs(x0-xp) < bt*w0 and abs(y0-h0/2-yp) < bt*h0) or
+             (abs(y0-yp) < bt*h0 and abs(x0+w0/2-xp) < bt*w0) or
+             (abs(y0-yp) < bt*h0 and abs(x0-w0/2-xp) < bt*w0))):
             expand = True
         else:
             expand = False
@@ -761,13 +851,13 @@ class NXellipse(NXpatch):
         dx, dy = (x-xp, y-yp)
         bt = self.border_tol
         if expand:
-            if (abs(x0-xp) < bt*w0 and abs(y0+np.true_divide(h0,2)-yp) < bt*h0):
+            if (abs(x0-xp) < bt*w0 and abs(y0+h0/2-yp) < bt*h0):
                 self.ellipse.height = h0 + dy
-            elif (abs(x0-xp) < bt*w0 and abs(y0-np.true_divide(h0,2)-yp) < bt*h0):
+            elif (abs(x0-xp) < bt*w0 and abs(y0-h0/2-yp) < bt*h0):
                 self.ellipse.height = h0 - dy
-            elif (abs(y0-yp) < bt*h0 and abs(x0+np.true_divide(w0,2)-xp) < bt*w0):
+            elif (abs(y0-yp) < bt*h0 and abs(x0+w0/2-xp) < bt*w0):
                 self.ellipse.width = w0 + dx
-            elif (abs(y0-yp) < bt*h0 and abs(x0-np.true_divide(w0,2)-xp) < bt*w0):
+            elif (abs(y0-yp) < bt*h0 and abs(x0-w0/2-xp) < bt*w0):
                 self.ellipse.width = w0 - dx
         else:
             self.ellipse.set_center((x0+dx, y0+dy))
@@ -819,8 +909,8 @@ class NXrectangle(NXpatch):
         w0, h0 = self.rectangle.get_width(), self.rectangle.get_height()
         bt = self.border_tol
         if (self.allow_resize and
-            (abs(x0+np.true_divide(w0,2)-xp)>np.true_divide(w0,2)-bt*w0 or
-             abs(y0+np.true_divide(h0,2)-yp)>np.true_divide(h0,2)-bt*h0)):
+            (abs(x0+w0/2-xp)>w0/2-bt*w0 or
+             abs(y0+h0/2-yp)>h0/2-bt*h0)):
             expand = True
         else:
             expand = False
@@ -35,7 +35,7 @@ class ImportDialog(BaseImportDialog):
 
         super(ImportDialog, self).__init__(parent)
 
-        token_file = os.path.join(os.path.expanduser('~'),'.nexpy',
+        token_file = os.path.join(self.mainwindow.nexpy_dir,
                                   'globusonline', 'gotoken.txt')
         self.wrap = CatalogWrapper(token='file', token_file=token_file)
         _,self.catalogs = self.wrap.catalogClient.get_catalogs()
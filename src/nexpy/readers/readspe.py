@@ -86,7 +86,7 @@ class ImportDialog(BaseImportDialog):
         filename = getOpenFileName(self, 'Open File', dirname)
         if os.path.exists(filename):    # avoids problems if <Cancel> was selected
             dirname = os.path.dirname(filename)
-            self.filename.setText(str(filename))
+            self.filename.setText(filename)
             self.set_default_directory(dirname)
 
         root, ext = os.path.splitext(filename)
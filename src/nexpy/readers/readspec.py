@@ -90,7 +90,7 @@ class ImportDialog(BaseImportDialog):
         dirname = self.get_default_directory(self.filename.text())
         filename = getOpenFileName(self, 'Open file', dirname)
         if os.path.exists(filename):
-            self.filename.setText(str(filename))
+            self.filename.setText(filename)
             self.spec = SpecDataFile(self.get_filename())
             self.set_default_directory(os.path.dirname(filename))
             all_scans = self.get_scan_numbers()
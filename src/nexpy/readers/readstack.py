@@ -118,7 +118,6 @@ class ImportDialog(BaseImportDialog):
 
     def choose_directory(self):
         super(ImportDialog, self).choose_directory()
-        files = self.get_filesindirectory()
         self.get_extensions()
         self.get_prefixes()
         self.filter_box.setVisible(True)
@@ -163,8 +162,8 @@ class ImportDialog(BaseImportDialog):
         self.get_prefixes()
  
     def get_extensions(self):
-        files = self.get_filesindirectory()
-        extensions =  set([os.path.splitext(f)[-1] for f in files])
+        extensions = set(os.path.splitext(f)[-1] 
+                         for f in self.iter_filesindirectory())
         self.extension_combo.clear()
         for extension in extensions:
             self.extension_combo.addItem(extension)
@@ -221,11 +220,11 @@ class ImportDialog(BaseImportDialog):
                                               self.get_extension())
         if self.get_indices():
             min, max = self.get_indices()
-            return [file for file in filenames 
-                    if self.get_index(file) >= min and 
-                    self.get_index(file) <= max]
-        else:
-            return filenames
+            filenames = [file for file in filenames 
+                         if self.get_index(file) >= min and 
+                         self.get_index(file) <= max]
+        directory = self.get_directory()
+        return [os.path.join(directory, file) for file in filenames]
 
     def set_range(self):
         files = self.get_filesindirectory(self.get_prefix(), 